@@ -194,7 +194,9 @@ def configure(
             then no span processors are used.
         default_span_processor: A function to create the default span processor. Defaults to `BatchSpanProcessor` from the OpenTelemetry SDK. You can configure the export delay for
             [`BatchSpanProcessor`](https://opentelemetry-python.readthedocs.io/en/latest/sdk/trace.export.html#opentelemetry.sdk.trace.export.BatchSpanProcessor)
-            by setting the `OTEL_BSP_SCHEDULE_DELAY_MILLIS` environment variable.
+            by setting the `OTEL_BSP_SCHEDULE_DELAY` environment variable (defaults to 500ms). The queue size, batch size
+            and export timeout can be tuned for high-throughput applications with the `OTEL_BSP_MAX_QUEUE_SIZE`,
+            `OTEL_BSP_MAX_EXPORT_BATCH_SIZE` and `OTEL_BSP_EXPORT_TIMEOUT` environment variables respectively.
         metric_readers: Sequence of metric readers to be used. If `None` then a default metrics reader is used.
             Pass an empty list to disable metrics.
             Ensure that `preferred_temporality=logfire.METRICS_PREFERRED_TEMPORALITY`
@@ -241,7 +243,7 @@ def _get_int_from_env(env_var: str) -> int | None:
     value = os.getenv(env_var)
     if not value:
         return None
-    return int(value)  # pragma: no cover
+    return int(value)
 
 
 @dataclasses.dataclass
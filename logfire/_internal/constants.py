@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 import warnings
 from typing import Literal
 
@@ -26,10 +27,13 @@ LEVEL_NUMBERS = {
 
 NUMBER_TO_LEVEL = {v: k for k, v in LEVEL_NUMBERS.items()}
 
-ATTRIBUTES_LOG_LEVEL_NAME_KEY = f'{LOGFIRE_ATTRIBUTES_NAMESPACE}.level_name'
+# Span and log attribute keys in the `logfire` namespace are interned with `sys.intern`, since Python only interns
+# string constants that look like identifiers, not keys built with f-strings or containing dots.
+# This lets dict lookups with keys that came from elsewhere usually be resolved by identity.
+ATTRIBUTES_LOG_LEVEL_NAME_KEY = sys.intern(f'{LOGFIRE_ATTRIBUTES_NAMESPACE}.level_name')
 """Deprecated, use only ATTRIBUTES_LOG_LEVEL_NUM_KEY."""
 
-ATTRIBUTES_LOG_LEVEL_NUM_KEY = f'{LOGFIRE_ATTRIBUTES_NAMESPACE}.level_num'
+ATTRIBUTES_LOG_LEVEL_NUM_KEY = sys.intern(f'{LOGFIRE_ATTRIBUTES_NAMESPACE}.level_num')
 """The key within OTEL attributes where logfire puts the log level number."""
 
 
@@ -46,33 +50,33 @@ def log_level_attributes(level: LevelName) -> dict[str, otel_types.AttributeValu
 
 SpanTypeType = Literal['log', 'pending_span', 'span']
 
-ATTRIBUTES_SPAN_TYPE_KEY = f'{LOGFIRE_ATTRIBUTES_NAMESPACE}.span_type'
+ATTRIBUTES_SPAN_TYPE_KEY = sys.intern(f'{LOGFIRE_ATTRIBUTES_NAMESPACE}.span_type')
 """Used to differentiate logs, pending spans and regular spans. Absences should be interpreted as a real span."""
 
-ATTRIBUTES_PENDING_SPAN_REAL_PARENT_KEY = f'{LOGFIRE_ATTRIBUTES_NAMESPACE}.pending_parent_id'
+ATTRIBUTES_PENDING_SPAN_REAL_PARENT_KEY = sys.intern(f'{LOGFIRE_ATTRIBUTES_NAMESPACE}.pending_parent_id')
 """The real parent of a pending span, i.e. the parent of it's corresponding span and also it's grandparent"""
 
-ATTRIBUTES_TAGS_KEY = f'{LOGFIRE_ATTRIBUTES_NAMESPACE}.tags'
+ATTRIBUTES_TAGS_KEY = sys.intern(f'{LOGFIRE_ATTRIBUTES_NAMESPACE}.tags')
 """The key within OTEL attributes where logfire puts tags."""
 
-ATTRIBUTES_MESSAGE_TEMPLATE_KEY = f'{LOGFIRE_ATTRIBUTES_NAMESPACE}.msg_template'
+ATTRIBUTES_MESSAGE_TEMPLATE_KEY = sys.intern(f'{LOGFIRE_ATTRIBUTES_NAMESPACE}.msg_template')
 """The message template for a log."""
 
-ATTRIBUTES_MESSAGE_KEY = f'{LOGFIRE_ATTRIBUTES_NAMESPACE}.msg'
+ATTRIBUTES_MESSAGE_KEY = sys.intern(f'{LOGFIRE_ATTRIBUTES_NAMESPACE}.msg')
 """The formatted message for a log."""
 
-DISABLE_CONSOLE_KEY = f'{LOGFIRE_ATTRIBUTES_NAMESPACE}.disable_console_log'
+DISABLE_CONSOLE_KEY = sys.intern(f'{LOGFIRE_ATTRIBUTES_NAMESPACE}.disable_console_log')
 """special attribute to disable console logging, on a per span basis."""
 
-ATTRIBUTES_JSON_SCHEMA_KEY = f'{LOGFIRE_ATTRIBUTES_NAMESPACE}.json_schema'
+ATTRIBUTES_JSON_SCHEMA_KEY = sys.intern(f'{LOGFIRE_ATTRIBUTES_NAMESPACE}.json_schema')
 """Key in OTEL attributes that collects the JSON schema."""
 
-ATTRIBUTES_LOGGING_ARGS_KEY = f'{LOGFIRE_ATTRIBUTES_NAMESPACE}.logging_args'
+ATTRIBUTES_LOGGING_ARGS_KEY = sys.intern(f'{LOGFIRE_ATTRIBUTES_NAMESPACE}.logging_args')
 
 ATTRIBUTES_VALIDATION_ERROR_KEY = 'exception.logfire.data'
 """The key within OTEL attributes where logfire puts validation errors."""
 
-NULL_ARGS_KEY = 'logfire.null_args'
+NULL_ARGS_KEY = sys.intern('logfire.null_args')
 """Key in OTEL attributes that collects attributes with a null (None) value."""
 
 PENDING_SPAN_NAME_SUFFIX = ' (pending)'
@@ -94,7 +98,7 @@ DEFAULT_FALLBACK_FILE_NAME = 'logfire_spans.bin'
 SUPPRESS_INSTRUMENTATION_CONTEXT_KEY = 'suppress_instrumentation'
 """Key in OTEL context that indicates whether instrumentation should be suppressed."""
 
-ATTRIBUTES_SAMPLE_RATE_KEY = 'logfire.sample_rate'
+ATTRIBUTES_SAMPLE_RATE_KEY = sys.intern('logfire.sample_rate')
 """Key in attributes that indicates the sample rate for this span."""
 
 CONTEXT_ATTRIBUTES_KEY = create_key('logfire.attributes')  # note this has a random suffix that OTEL adds
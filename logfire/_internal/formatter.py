@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import warnings
+from functools import lru_cache
 from string import Formatter
-from typing import Any, Final, Literal, Mapping
+from typing import Any, Final, Iterable, Literal, Mapping, Tuple, Union
 
 from typing_extensions import NotRequired, TypedDict
 
@@ -24,9 +25,22 @@ class ArgChunk(TypedDict):
     spec: NotRequired[str]
 
 
+ParsedTemplate = Tuple[Tuple[str, Union[str, None], Union[str, None], Union[str, None]], ...]
+
+
+# Message templates are almost always constants (e.g. from `@instrument` or a literal in a `logfire.info` call),
+# so cache parsing them rather than repeating it for every span and log.
+@lru_cache(maxsize=2048)
+def parse_template(format_string: str) -> ParsedTemplate:
+    return tuple(Formatter().parse(format_string))
+
+
 class ChunksFormatter(Formatter):
     NONE_REPR: Final[str] = 'null'
 
+    def parse(self, format_string: str) -> Iterable[tuple[str, str | None, str | None, str | None]]:
+        return parse_template(format_string)
+
     def chunks(
         self,
         format_string: str,
@@ -83,7 +97,12 @@ class ChunksFormatter(Formatter):
                 # given the field_name, find the object it references
                 #  and the argument it came from
                 try:
-                    obj, _arg_used = self.get_field(field_name, args, kwargs)
+                    if field_name.isidentifier():
+                        # Plain names are by far the most common, look them up directly
+                        # rather than having `get_field` split the name into attribute and index accesses.
+                        obj = kwargs[field_name]
+                    else:
+                        obj, _arg_used = self.get_field(field_name, args, kwargs)
                 except KeyError as exc:
                     try:
                         # fall back to getting a key with the dots in the name
@@ -98,19 +117,20 @@ class ChunksFormatter(Formatter):
                     obj = self.convert_field(obj, conversion)
 
                 # expand the format spec, if needed
-                format_spec, auto_arg_index = self._vformat(
-                    format_spec,  # type: ignore[arg-type]
-                    args,
-                    kwargs,
-                    used_args,  # TODO(lig): using `_arg_used` from above seems logical here but needs more thorough testing
-                    recursion_depth - 1,
-                    auto_arg_index=auto_arg_index,
-                )
+                if format_spec:
+                    format_spec, auto_arg_index = self._vformat(
+                        format_spec,
+                        args,
+                        kwargs,
+                        used_args,  # TODO(lig): using `_arg_used` from above seems logical here but needs more thorough testing
+                        recursion_depth - 1,
+                        auto_arg_index=auto_arg_index,
+                    )
 
                 if obj is None:
                     value = self.NONE_REPR
                 else:
-                    value = self.format_field(obj, format_spec)
+                    value = self.format_field(obj, format_spec or '')
                     # Scrub before truncating so that the scrubber can see the full value.
                     # For example, if the value contains 'password=123' and 'password' is replaced by '...'
                     # because of truncation, then that leaves '=123' in the message, which is not good.
@@ -128,13 +148,15 @@ class ChunksFormatter(Formatter):
 chunks_formatter = ChunksFormatter()
 
 
-def logfire_format(format_string: str, kwargs: dict[str, Any], scrubber: Scrubber, stack_offset: int = 3) -> str:
+def logfire_format(format_string: str, kwargs: Mapping[str, Any], scrubber: Scrubber, stack_offset: int = 3) -> str:
     return ''.join(
-        chunk['v']
-        for chunk in chunks_formatter.chunks(
-            format_string,
-            kwargs,
-            scrubber=scrubber,
-            stack_offset=stack_offset,
-        )
+        [
+            chunk['v']
+            for chunk in chunks_formatter.chunks(
+                format_string,
+                kwargs,
+                scrubber=scrubber,
+                stack_offset=stack_offset,
+            )
+        ]
     )
@@ -57,11 +57,6 @@ if TYPE_CHECKING:
     from starlette.requests import Request
     from starlette.websockets import WebSocket
 
-try:
-    from pydantic import ValidationError
-except ImportError:  # pragma: no cover
-    ValidationError = None
-
 
 # This is the type of the exc_info/_exc_info parameter of the log methods.
 # sys.exc_info() returns a tuple of (type, value, traceback) or (None, None, None).
@@ -97,6 +92,8 @@ class Logfire:
         self._stack_offset = stack_offset
         self._console_log = console_log
         self._otel_scope = otel_scope
+        # Tracers for `log(custom_scope_suffix=...)`, which integrations like stdlib logging call for every record.
+        self._scoped_logs_tracers: dict[str, Tracer] = {}
 
     @property
     def config(self) -> LogfireConfig:
@@ -136,8 +133,10 @@ class Logfire:
         _level: LevelName | None = None,
         _stack_offset: int = 3,
     ) -> LogfireSpan:
-        stack_info = get_caller_stack_info(_stack_offset)
-        merged_attributes = {**stack_info, **attributes}
+        # `get_caller_stack_info` returns a new dict each time so it's safe to merge into it.
+        merged_attributes = cast('dict[str, Any]', get_caller_stack_info(_stack_offset))
+        if attributes:
+            merged_attributes.update(attributes)
 
         log_message = logfire_format(
             msg_template, merged_attributes, self._config.scrubber, stack_offset=_stack_offset + 2
@@ -150,9 +149,8 @@ class Logfire:
         if json_schema_properties := attributes_json_schema_properties(attributes):
             otlp_attributes[ATTRIBUTES_JSON_SCHEMA_KEY] = attributes_json_schema(json_schema_properties)
 
-        tags = (self._tags or ()) + tuple(_tags or ())
-        if tags:
-            otlp_attributes[ATTRIBUTES_TAGS_KEY] = uniquify_sequence(tags)
+        if self._tags or _tags:
+            otlp_attributes[ATTRIBUTES_TAGS_KEY] = uniquify_sequence(self._tags + tuple(_tags or ()))
 
         sample_rate = (
             self._sample_rate
@@ -194,7 +192,9 @@ class Logfire:
         )
         if json_schema_properties := attributes_json_schema_properties(function_args):
             attributes[ATTRIBUTES_JSON_SCHEMA_KEY] = attributes_json_schema(json_schema_properties)
-        attributes.update(user_attributes(function_args))
+        # `attributes` is a fresh dict built by the instrumented function on each call,
+        # so write the converted arguments straight into it rather than building and merging another dict.
+        set_user_attributes(attributes, function_args)
         return self._fast_span(name, attributes)
 
     def trace(
@@ -531,26 +531,27 @@ class Logfire:
                 See `TraceProvider.get_tracer(instrumenting_module_name)` docstring for more info.
         """
         stack_offset = (self._stack_offset if stack_offset is None else stack_offset) + 2
-        stack_info = get_caller_stack_info(stack_offset)
+        # `get_caller_stack_info` returns a new dict each time so it's safe to merge into it.
+        merged_attributes = cast('dict[str, Any]', get_caller_stack_info(stack_offset))
 
-        attributes = attributes or {}
-        merged_attributes = {**stack_info, **attributes}
+        if attributes:
+            merged_attributes.update(attributes)
+        else:
+            attributes = {}
         if (msg := attributes.pop(ATTRIBUTES_MESSAGE_KEY, None)) is None:
             msg = logfire_format(msg_template, merged_attributes, self._config.scrubber, stack_offset=stack_offset + 2)
-        otlp_attributes = user_attributes(merged_attributes)
-        otlp_attributes = {
+        otlp_attributes: dict[str, otel_types.AttributeValue] = {
             ATTRIBUTES_SPAN_TYPE_KEY: 'log',
             **log_level_attributes(level),
             ATTRIBUTES_MESSAGE_TEMPLATE_KEY: msg_template,
             ATTRIBUTES_MESSAGE_KEY: msg,
-            **otlp_attributes,
         }
+        set_user_attributes(otlp_attributes, merged_attributes)
         if json_schema_properties := attributes_json_schema_properties(attributes):
             otlp_attributes[ATTRIBUTES_JSON_SCHEMA_KEY] = attributes_json_schema(json_schema_properties)
 
-        tags = self._tags + tuple(tags or ())
-        if tags:
-            otlp_attributes[ATTRIBUTES_TAGS_KEY] = uniquify_sequence(tags)
+        if self._tags or tags:
+            otlp_attributes[ATTRIBUTES_TAGS_KEY] = uniquify_sequence(self._tags + tuple(tags or ()))
 
         sample_rate = (
             self._sample_rate
@@ -565,7 +566,11 @@ class Logfire:
         start_time = self._config.ns_timestamp_generator()
 
         if custom_scope_suffix:
-            tracer = self._get_tracer(is_span_tracer=False, otel_scope=f'logfire.{custom_scope_suffix}')
+            tracer = self._scoped_logs_tracers.get(custom_scope_suffix)
+            if tracer is None:
+                tracer = self._scoped_logs_tracers[custom_scope_suffix] = self._get_tracer(
+                    is_span_tracer=False, otel_scope=f'logfire.{custom_scope_suffix}'
+                )
         else:
             tracer = self._logs_tracer
 
@@ -581,7 +586,9 @@ class Logfire:
             if isinstance(exc_info, tuple):
                 exc_info = exc_info[1]
             if isinstance(exc_info, BaseException):
-                _record_exception(span, exc_info)
+                # Check if the log has been sampled out first, since _record_exception is somewhat expensive.
+                if span.is_recording():
+                    _record_exception(span, exc_info)
             elif exc_info is not None:  # pragma: no cover
                 raise TypeError(f'Invalid type for exc_info: {exc_info.__class__.__name__}')
 
@@ -649,14 +656,32 @@ class Logfire:
             A new Logfire instance with the given settings applied.
         """
         # TODO add sample_rate once it's more stable
-        return Logfire(
+        new_logfire = Logfire(
             config=self._config,
-            tags=self._tags + tuple(tags),
+            tags=self._tags + tuple(tags) if tags else self._tags,
             sample_rate=self._sample_rate,
             stack_offset=self._stack_offset if stack_offset is None else stack_offset,
             console_log=self._console_log if console_log is None else console_log,
             otel_scope=self._otel_scope if custom_scope_suffix is None else f'logfire.{custom_scope_suffix}',
         )
+        self._share_tracers(new_logfire)
+        return new_logfire
+
+    def _share_tracers(self, new_logfire: Logfire) -> None:
+        """Give `new_logfire` the tracers this instance has already created.
+
+        `new_logfire` must share this instance's config. Tracers only depend on the config and the OTEL scope,
+        so there's no need to create and register new ones for every derived instance.
+        """
+        new_logfire._scoped_logs_tracers = self._scoped_logs_tracers
+        if new_logfire._otel_scope != self._otel_scope:
+            return
+        for tracer_property in (Logfire._tracer_provider, Logfire._logs_tracer, Logfire._spans_tracer):
+            # Only copy values that have already been computed, so that deriving an instance doesn't initialize
+            # the config early.
+            name = tracer_property.attrname
+            if name is not None and name in self.__dict__:
+                new_logfire.__dict__[name] = self.__dict__[name]
 
     def force_flush(self, timeout_millis: int = 3_000) -> bool:  # pragma: no cover
         """Force flush all spans.
@@ -1120,12 +1145,25 @@ class FastLogfireSpan:
     def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: Any) -> None:
         atexit.unregister(self._atexit)
         context_api.detach(self._token)
-        _exit_span(self._span, exc_value)
+        if exc_value is not None:
+            _exit_span(self._span, exc_value)
         self._span.end()
 
 
 # Changes to this class may need to be reflected in `FastLogfireSpan` as well.
 class LogfireSpan(ReadableSpan):
+    __slots__ = (
+        '_span_name',
+        '_otlp_attributes',
+        '_tracer',
+        '_json_schema_properties',
+        '_added_attributes',
+        '_token',
+        '_span',
+        'end_on_exit',
+        '_atexit',
+    )
+
     def __init__(
         self,
         span_name: str,
@@ -1139,7 +1177,6 @@ class LogfireSpan(ReadableSpan):
         self._json_schema_properties = json_schema_properties
 
         self._added_attributes = False
-        self._end_on_exit: bool | None = None
         self._token: None | object = None
         self._span: None | trace_api.Span = None
         self.end_on_exit = True
@@ -1176,14 +1213,12 @@ class LogfireSpan(ReadableSpan):
         self._token = None
 
         assert self._span is not None
-        _exit_span(self._span, exc_value)
+        if exc_value is not None:
+            _exit_span(self._span, exc_value)
 
-        end_on_exit_ = self.end_on_exit
-        if end_on_exit_:
+        if self.end_on_exit:
             self.end()
 
-        self._token = None
-
     @property
     def message_template(self) -> str | None:  # pragma: no cover
         return self._get_attribute(ATTRIBUTES_MESSAGE_TEMPLATE_KEY, None)
@@ -1283,7 +1318,7 @@ class LogfireSpan(ReadableSpan):
         return attributes.get(key, default)
 
 
-def _exit_span(span: trace_api.Span, exception: BaseException | None) -> None:
+def _exit_span(span: trace_api.Span, exception: BaseException) -> None:
     if not span.is_recording():
         return
 
@@ -1316,11 +1351,16 @@ def _record_exception(
         span.set_attributes(log_level_attributes('error'))
 
     attributes = {**(attributes or {})}
-    if ValidationError is not None and isinstance(exception, ValidationError):
-        # insert a more detailed breakdown of pydantic errors
-        err_json = exception.json(include_url=False)
-        span.set_attribute(ATTRIBUTES_VALIDATION_ERROR_KEY, err_json)
-        attributes[ATTRIBUTES_VALIDATION_ERROR_KEY] = err_json
+    # The exception can only be a pydantic `ValidationError` if pydantic has already been imported,
+    # so check that rather than importing pydantic whenever logfire is imported.
+    if 'pydantic' in sys.modules:  # pragma: no branch
+        from pydantic import ValidationError
+
+        if isinstance(exception, ValidationError):
+            # insert a more detailed breakdown of pydantic errors
+            err_json = exception.json(include_url=False)
+            span.set_attribute(ATTRIBUTES_VALIDATION_ERROR_KEY, err_json)
+            attributes[ATTRIBUTES_VALIDATION_ERROR_KEY] = err_json
 
     if exception is not sys.exc_info()[1]:
         # OTEL's record_exception uses `traceback.format_exc()` which is for the current exception,
@@ -1332,6 +1372,8 @@ def _record_exception(
     span.record_exception(exception, attributes=attributes, timestamp=timestamp, escaped=escaped)
 
 
+_SCALAR_TYPES = (str, bool, float)
+
 AttributesValueType = TypeVar('AttributesValueType', bound=Union[Any, otel_types.AttributeValue])
 
 
@@ -1341,11 +1383,31 @@ def user_attributes(attributes: dict[str, Any]) -> dict[str, otel_types.Attribut
     This will convert any non-OpenTelemetry compatible types to JSON.
     """
     otlp_attributes: dict[str, otel_types.AttributeValue] = {}
+    set_user_attributes(otlp_attributes, attributes)
+    return otlp_attributes
 
-    for key, value in attributes.items():
-        set_user_attribute(otlp_attributes, key, value)
 
-    return otlp_attributes
+def set_user_attributes(otlp_attributes: dict[str, otel_types.AttributeValue], attributes: dict[str, Any]) -> None:
+    """Convert user attributes to OpenTelemetry compatible types and add them to the given dictionary.
+
+    This allows building the final attributes in a single dictionary instead of merging several.
+    """
+    # Fast path for the common case where every value can be sent as is.
+    # `type(...)` is checked rather than `isinstance` as it's cheaper, subclasses just take the slow path.
+    for value in attributes.values():
+        value_type = type(value)  # type: ignore
+        if value_type in _SCALAR_TYPES or (value_type is int and value <= OTLP_MAX_INT_SIZE):
+            continue
+        break
+    else:
+        otlp_attributes.update(attributes)
+        return
+
+    for key, value in attributes.items():
+        if type(value) in _SCALAR_TYPES:
+            otlp_attributes[key] = value
+        else:
+            set_user_attribute(otlp_attributes, key, value)
 
 
 def set_user_attribute(
@@ -1358,8 +1420,13 @@ def set_user_attribute(
     """
     otel_value: otel_types.AttributeValue
     if value is None:
-        otel_value = cast('list[str]', otlp_attributes.get(NULL_ARGS_KEY, [])) + [key]
+        # The list is always one we created, so append in place rather than copying it for each null value.
+        otel_value = cast('list[str]', otlp_attributes.get(NULL_ARGS_KEY, []))
+        otel_value.append(key)
         key = NULL_ARGS_KEY
+    elif type(value) in _SCALAR_TYPES:
+        # Cheaper than the `isinstance` checks below, which are only needed for subclasses and ints.
+        otel_value = value
     elif isinstance(value, int):
         if value > OTLP_MAX_INT_SIZE:
             warnings.warn(
@@ -13,7 +13,7 @@ import pytest
 import requests_mock
 from opentelemetry.sdk.metrics.export import InMemoryMetricReader
 from opentelemetry.sdk.trace import ReadableSpan
-from opentelemetry.sdk.trace.export import SimpleSpanProcessor, SpanExporter, SpanExportResult
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor, SpanExporter, SpanExportResult
 from pytest import LogCaptureFixture
 
 import logfire
@@ -23,6 +23,7 @@ from logfire._internal.config import (
     ConsoleOptions,
     LogfireConfig,
     LogfireCredentials,
+    _get_default_span_processor,  # type: ignore
     sanitize_project_name,
 )
 from logfire._internal.exporters.fallback import FallbackSpanExporter
@@ -544,6 +545,28 @@ def test_configure_fallback_path(tmp_path: str) -> None:
     assert path.exists()
 
 
+def test_default_span_processor_env_vars() -> None:
+    exporter = TestExporter()
+    with patch.dict(
+        os.environ,
+        {
+            'OTEL_BSP_SCHEDULE_DELAY': '1000',
+            'OTEL_BSP_MAX_QUEUE_SIZE': '4096',
+            'OTEL_BSP_MAX_EXPORT_BATCH_SIZE': '256',
+            'OTEL_BSP_EXPORT_TIMEOUT': '10000',
+        },
+    ):
+        processor = _get_default_span_processor(exporter)
+    try:
+        assert isinstance(processor, BatchSpanProcessor)
+        assert processor.schedule_delay_millis == 1000
+        assert processor.queue.maxlen == 4096
+        assert processor.max_export_batch_size == 256
+        assert processor.export_timeout_millis == 10000
+    finally:
+        processor.shutdown()
+
+
 def test_configure_service_version(tmp_path: str) -> None:
     request_mocker = requests_mock.Mocker()
     request_mocker.get(
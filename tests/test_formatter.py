@@ -3,7 +3,7 @@ from typing import Any, Mapping
 
 from inline_snapshot import snapshot
 
-from logfire._internal.formatter import chunks_formatter, logfire_format
+from logfire._internal.formatter import chunks_formatter, logfire_format, parse_template
 from logfire._internal.scrubbing import Scrubber
 
 
@@ -85,3 +85,14 @@ def test_truncate():
         ' 3'
     )
     assert len(message) == snapshot(261)
+
+
+def test_parse_template_cached():
+    assert parse_template('foo {bar=} {baz:{spec}}') == snapshot(
+        (('foo ', 'bar=', '', None), (' ', 'baz', '{spec}', None))
+    )
+    assert parse_template('foo {bar=} {baz:{spec}}') is parse_template('foo {bar=} {baz:{spec}}')
+
+    v = chunks('{a}: {b:{spec}}', {'a': 1, 'b': 2.5, 'spec': '.2f'})
+    # insert_assert(v)
+    assert v == [{'t': 'arg', 'v': '1'}, {'t': 'lit', 'v': ': '}, {'t': 'arg', 'v': '2.50', 'spec': '.2f'}]
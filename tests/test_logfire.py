@@ -584,6 +584,25 @@ def test_log_with_multiple_tags(exporter: TestExporter):
     assert s.attributes[ATTRIBUTES_TAGS_KEY] == ('tag1', 'tag2', 'tag3', 'tag4')
 
 
+def test_with_settings_shares_tracers(exporter: TestExporter):
+    with logfire.span('create the tracers'):
+        logfire.info('create the tracers')
+    exporter.clear()
+
+    tagged = logfire.with_tags('tag1')
+    assert tagged._logs_tracer is logfire.DEFAULT_LOGFIRE_INSTANCE._logs_tracer  # type: ignore
+    assert tagged._spans_tracer is logfire.DEFAULT_LOGFIRE_INSTANCE._spans_tracer  # type: ignore
+
+    scoped = logfire.with_settings(custom_scope_suffix='custom')
+    assert scoped._logs_tracer is not logfire.DEFAULT_LOGFIRE_INSTANCE._logs_tracer  # type: ignore
+
+    tagged.info('tagged')
+    scoped.info('scoped')
+    assert [span.instrumentation_scope.name for span in exporter.exported_spans] == snapshot(  # type: ignore
+        ['logfire', 'logfire.custom']
+    )
+
+
 def test_instrument(exporter: TestExporter):
     @logfire.instrument('hello-world {a=}')
     def hello_world(a: int) -> str:
@@ -1585,6 +1604,17 @@ def test_exc_info(exporter: TestExporter):
         }
 
 
+def test_span_base_exception(exporter: TestExporter):
+    with pytest.raises(KeyboardInterrupt):
+        with logfire.span('interrupted'):
+            raise KeyboardInterrupt
+
+    # Only `Exception`s are recorded, so the span ends normally without an exception event.
+    [span_dict] = exporter.exported_spans_as_dict()
+    assert span_dict['name'] == 'interrupted'
+    assert 'events' not in span_dict
+
+
 def test_span_level(exporter: TestExporter):
     with logfire.span('foo', _level='debug') as span:
         span.set_level('warn')
@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 from opentelemetry.sdk.metrics.export import InMemoryMetricReader
@@ -185,3 +186,40 @@ def test_sampling_rate_does_not_get_overwritten() -> None:  # pragma: no cover
 
     # insert_assert(build_tree(exporter.exported_spans_as_dict()))
     assert build_tree(exporter.exported_spans_as_dict()) == []
+
+
+def test_sampled_out_span_with_exception() -> None:
+    exporter = TestExporter()
+
+    logfire.configure(
+        send_to_logfire=False,
+        trace_sample_rate=0,
+        processors=[SimpleSpanProcessor(exporter)],
+        metric_readers=[InMemoryMetricReader()],
+    )
+
+    with pytest.raises(ValueError):
+        with logfire.span('outer'):
+            raise ValueError('an error')
+
+    assert exporter.exported_spans_as_dict() == []
+
+
+def test_sampled_out_log_skips_exception_recording() -> None:
+    exporter = TestExporter()
+
+    logfire.configure(
+        send_to_logfire=False,
+        trace_sample_rate=0,
+        processors=[SimpleSpanProcessor(exporter)],
+        metric_readers=[InMemoryMetricReader()],
+    )
+
+    with patch('logfire._internal.main._record_exception') as record_exception:
+        try:
+            raise ValueError('an error')
+        except ValueError:
+            logfire.error('error', _exc_info=True)
+
+    record_exception.assert_not_called()
+    assert exporter.exported_spans_as_dict() == []
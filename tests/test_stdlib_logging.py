@@ -272,3 +272,13 @@ def test_logging_from_opentelemetry(exporter: TestExporter) -> None:
             },
         ]
     )
+
+
+def test_stdlib_logging_reuses_scoped_tracer(exporter: TestExporter, logger: Logger) -> None:
+    logger.error('first')
+    logger.error('second')
+
+    assert [span.instrumentation_scope.name for span in exporter.exported_spans] == snapshot(  # type: ignore
+        ['logfire.stdlib.logging', 'logfire.stdlib.logging']
+    )
+    assert 'stdlib.logging' in logfire.DEFAULT_LOGFIRE_INSTANCE._scoped_logs_tracers  # type: ignore